@@ -4,6 +4,242 @@ import numpy as np
 import numpy.linalg as nla
 import scipy.linalg as sla
 import abc
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import mici._fast_kernels as _fast_kernels
+
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+"""Minimum operand size for dispatching elementwise products to numexpr.
+
+For small operands the overhead of parsing and compiling a numexpr expression
+outweighs any gain from its blocked evaluation, therefore elementwise products
+are only evaluated with numexpr (when available) for operands with at least
+this many elements.
+"""
+NUMEXPR_SIZE_THRESHOLD = 2**16
+
+"""Maximum matrix dimension for dispatching matrix-vector products to Numba.
+
+For small operands the Python-level dispatch overhead of chaining separate
+BLAS calls dominates the arithmetic cost, so fused Numba kernels (when
+available) are used instead up to this dimension, beyond which the blocked
+BLAS routines win out.
+"""
+NUMBA_MATVEC_SIZE_THRESHOLD = 128
+
+_block_multiply_pool = None
+
+
+def _get_block_multiply_pool():
+    """Lazily construct shared thread pool for per-block matrix multiplies.
+
+    Multiplications of the individual blocks of a block diagonal matrix are
+    independent and the underlying BLAS routines release the global
+    interpreter lock, so the blocks can be usefully dispatched concurrently
+    to a thread pool. The pool is created on first use to avoid spawning
+    threads on module import for code paths which never multiply block
+    diagonal matrices.
+    """
+    global _block_multiply_pool
+    if _block_multiply_pool is None:
+        _block_multiply_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count(),
+            thread_name_prefix='mici-block-multiply')
+    return _block_multiply_pool
+
+
+def _reset_block_multiply_pool():
+    """Discard any thread pool inherited from a forking parent process.
+
+    Threads are not carried over in to fork-started child processes, so a
+    pool created in the parent would accept work in the child which no
+    worker thread will ever execute, deadlocking the child on the first
+    block diagonal multiply. Clearing the global forces each child to
+    lazily create its own pool on first use.
+    """
+    global _block_multiply_pool
+    _block_multiply_pool = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_block_multiply_pool)
+
+
+@lru_cache(maxsize=None)
+def _lapack_getrs_for_dtype(dtype):
+    """Get LAPACK `getrs` solve routine for a data type.
+
+    Memoised at module level rather than on matrix instances as the
+    returned LAPACK function objects cannot be pickled, which would
+    otherwise prevent serialising matrices with cached factorisations in to
+    the worker processes used for parallel chain sampling.
+
+    Args:
+        dtype (dtype): NumPy data type of arrays routine will be called on.
+
+    Returns:
+        getrs (callable): LAPACK routine solving a system in pivoted LU
+            factored form for the given data type.
+    """
+    return sla.get_lapack_funcs('getrs', dtype=dtype)
+
+
+@lru_cache(maxsize=256)
+def _matrix_chain_splits(dims):
+    """Compute optimal split points for evaluating a matrix chain product.
+
+    Uses the classic O(n**2) space / O(n**3) time dynamic programming
+    algorithm to find the parenthesisation of a matrix chain product which
+    minimises the total number of scalar multiplications, assuming dense
+    matrix multiplication of a `(p, q)` and `(q, r)` shaped matrix pair costs
+    `p * q * r` multiplications.
+
+    Args:
+        dims (Tuple[int, ...]): Dimensions of matrices in chain, with matrix
+            `i` in the chain having shape `(dims[i], dims[i + 1])`.
+
+    Returns:
+        splits (array): 2D integer array with `splits[i, j]` the index to
+            split the sub-chain of matrices `i` to `j` (inclusive) at for the
+            optimal evaluation order, i.e. the product of matrices `i` to `j`
+            is evaluated as the product of the (recursively optimally ordered)
+            products of matrices `i` to `splits[i, j]` and matrices
+            `splits[i, j] + 1` to `j`.
+
+    Results are memoised on the chain dimensions so that repeatedly applying
+    products with an identical shape signature, as is typical across the
+    steps of a sampling run, only pays the dynamic programming cost once.
+    """
+    num_matrices = len(dims) - 1
+    costs = np.zeros((num_matrices, num_matrices))
+    splits = np.zeros((num_matrices, num_matrices), dtype=np.intp)
+    for length in range(1, num_matrices):
+        for i in range(num_matrices - length):
+            j = i + length
+            costs[i, j] = np.inf
+            for k in range(i, j):
+                cost = (costs[i, k] + costs[k + 1, j] +
+                        dims[i] * dims[k + 1] * dims[j + 1])
+                if cost < costs[i, j]:
+                    costs[i, j] = cost
+                    splits[i, j] = k
+    return splits
+
+
+def _collapse_scaled_identity_factors(matrices):
+    """Collapse runs of (scaled) identity factors in a matrix chain.
+
+    Fuses consecutive `IdentityMatrix` / `ScaledIdentityMatrix` factors in a
+    matrix chain in to at most one scaled identity factor, removing identity
+    factors entirely when a non-trivial factor remains, so that repeatedly
+    scalar multiplying a product does not grow the chain of factors iterated
+    over on each matrix multiplication.
+
+    Args:
+        matrices (Tuple[Matrix, ...]): Sequence of matrices forming product in
+            left-to-right order.
+
+    Returns:
+        collapsed (Tuple[Matrix, ...]): Sequence of matrices with any runs of
+            (scaled) identity factors collapsed, representing the same matrix
+            product as `matrices`.
+    """
+    collapsed = []
+    scalar, size = 1, None
+    for matrix in matrices:
+        if isinstance(matrix, IdentityMatrix):
+            size = matrix.shape[0] if size is None else size
+        elif isinstance(matrix, ScaledIdentityMatrix):
+            scalar = scalar * matrix._scalar
+            size = matrix.shape[0] if size is None else size
+        else:
+            collapsed.append(matrix)
+    if not collapsed:
+        if scalar == 1:
+            return (IdentityMatrix(size),)
+        elif scalar > 0:
+            return (PositiveScaledIdentityMatrix(scalar, size),)
+        else:
+            return (ScaledIdentityMatrix(scalar, size),)
+    if scalar != 1:
+        collapsed.insert(0, (
+            PositiveScaledIdentityMatrix(scalar, collapsed[0].shape[0])
+            if scalar > 0 else
+            ScaledIdentityMatrix(scalar, collapsed[0].shape[0])))
+    return tuple(collapsed)
+
+
+def _fuse_structured_factors(matrices):
+    """Fuse adjacent compatibly structured factors in a matrix chain.
+
+    Merges neighbouring pairs of factors whose product retains an exploitable
+    structure - two diagonal factors fuse to a single diagonal factor, a
+    scaled identity followed by a diagonal factor folds in to the diagonal
+    and two same-orientation triangular factors fuse via a BLAS triangular
+    matrix product - so that applying the chain makes fewer passes over the
+    operand.
+
+    Args:
+        matrices (Tuple[Matrix, ...]): Sequence of matrices forming product in
+            left-to-right order.
+
+    Returns:
+        fused (Tuple[Matrix, ...]): Sequence of matrices with any adjacent
+            compatibly structured factors fused, representing the same matrix
+            product as `matrices`.
+    """
+    fused = [matrices[0]]
+    for matrix in matrices[1:]:
+        prev = fused[-1]
+        if (isinstance(prev, DiagonalMatrix) and
+                isinstance(matrix, DiagonalMatrix)):
+            fused[-1] = DiagonalMatrix(prev.diagonal * matrix.diagonal)
+        elif (isinstance(prev, ScaledIdentityMatrix) and
+                isinstance(matrix, DiagonalMatrix)):
+            fused[-1] = DiagonalMatrix(prev._scalar * matrix.diagonal)
+        elif (isinstance(prev, TriangularMatrix) and
+                isinstance(matrix, TriangularMatrix) and
+                prev.lower == matrix.lower):
+            trmm = sla.get_blas_funcs('trmm', (prev.array, matrix.array))
+            fused[-1] = TriangularMatrix(
+                trmm(1., prev.array, matrix.array, lower=prev.lower),
+                lower=prev.lower)
+        else:
+            fused.append(matrix)
+    return tuple(fused)
+
+
+def _matrix_vector_multiply(matrix, vector):
+    """Left multiply a 1D vector by a matrix, preferring a direct BLAS gemv.
+
+    For explicit array matrices this skips the generic matrix multiplication
+    operator dispatch and calls the BLAS 2 matrix-vector product directly.
+    """
+    if isinstance(matrix, ExplicitArrayMatrix):
+        gemv = sla.get_blas_funcs('gemv', (matrix._array, vector))
+        return gemv(1., matrix._array, vector)
+    return matrix._left_matrix_multiply(vector)
+
+
+def _vector_matrix_multiply(vector, matrix):
+    """Right multiply a 1D vector by a matrix, preferring a direct BLAS gemv.
+
+    For explicit array matrices this skips the generic matrix multiplication
+    operator dispatch and calls the BLAS 2 matrix-vector product directly
+    with the matrix transposed.
+    """
+    if isinstance(matrix, ExplicitArrayMatrix):
+        gemv = sla.get_blas_funcs('gemv', (matrix._array, vector))
+        return gemv(1., matrix._array, vector, trans=1)
+    return matrix._right_matrix_multiply(vector)
 
 
 def _choose_matrix_product_class(matrix_l, matrix_r):
@@ -62,14 +298,32 @@ class Matrix(abc.ABC):
     def __neg__(self):
         return self._scalar_multiply(-1)
 
+    def _chain_factors(self):
+        """Factors contributed by this matrix to a flat matrix product chain.
+
+        Overridden by `MatrixProduct` so that products of products are built
+        as a single flat chain of factors rather than as nested products.
+        """
+        return (self,)
+
     def __matmul__(self, other):
         if self.shape[1] is not None and other.shape[0] != self.shape[1]:
             raise ValueError(
                 f'Inconsistent dimensions for matrix multiplication: '
                 f'{self.shape} and {other.shape}.')
         if isinstance(other, Matrix):
+            if isinstance(self, IdentityMatrix):
+                return other
+            elif isinstance(other, IdentityMatrix):
+                return self
+            elif isinstance(self, ScaledIdentityMatrix):
+                return other._scalar_multiply(self._scalar)
+            elif isinstance(other, ScaledIdentityMatrix):
+                return self._scalar_multiply(other._scalar)
             matrix_product_class = _choose_matrix_product_class(self, other)
-            return matrix_product_class((self, other), check_shapes=False)
+            return matrix_product_class(
+                self._chain_factors() + other._chain_factors(),
+                check_shapes=False)
         else:
             return self._left_matrix_multiply(other)
 
@@ -79,8 +333,18 @@ class Matrix(abc.ABC):
                 f'Inconsistent dimensions for matrix multiplication: '
                 f'{other.shape} and {self.shape}.')
         if isinstance(other, Matrix):
+            if isinstance(other, IdentityMatrix):
+                return self
+            elif isinstance(self, IdentityMatrix):
+                return other
+            elif isinstance(other, ScaledIdentityMatrix):
+                return self._scalar_multiply(other._scalar)
+            elif isinstance(self, ScaledIdentityMatrix):
+                return other._scalar_multiply(self._scalar)
             matrix_product_class = _choose_matrix_product_class(self, other)
-            return matrix_product_class((other, self), check_shapes=False)
+            return matrix_product_class(
+                other._chain_factors() + self._chain_factors(),
+                check_shapes=False)
         else:
             return self._right_matrix_multiply(other)
 
@@ -216,26 +480,91 @@ class MatrixProduct(ImplicitArrayMatrix):
                     raise ValueError(
                         f'Matrices {matrix_l} and {matrix_r} have inconsistent'
                         f' inner dimensions for forming a matrix product.')
+        if len(self._matrices) > 1:
+            self._matrices = _collapse_scaled_identity_factors(self._matrices)
+        if len(self._matrices) > 1:
+            self._matrices = _fuse_structured_factors(self._matrices)
         super().__init__((self._matrices[0].shape[0],
                           self._matrices[-1].shape[1]))
+        chain_dims = tuple(
+            [matrix.shape[0] for matrix in self._matrices] +
+            [self._matrices[-1].shape[1]])
+        self._chain_dims = None if None in chain_dims else chain_dims
 
     @property
     def matrices(self):
         return self._matrices
 
+    def _chain_factors(self):
+        return self._matrices
+
     def _scalar_multiply(self, scalar):
+        matrix_first = self._matrices[0]
+        if isinstance(matrix_first, (IdentityMatrix, ScaledIdentityMatrix)):
+            return type(self)(
+                (scalar * matrix_first, *self._matrices[1:]))
         return type(self)((
             ScaledIdentityMatrix(scalar, self.shape[0]), *self.matrices))
 
+    def _evaluate_chain(self, splits, index_l, index_r, operand, operand_index):
+        """Evaluate (sub)chain of matrices and array operand in optimal order.
+
+        Evaluates the product of the chain 'factors' with indices `index_l` to
+        `index_r` (inclusive), where the factor with index `operand_index` is
+        the array `operand` and the factor with index `i` otherwise is the
+        matrix `self.matrices[i]` (`self.matrices[i - 1]` when
+        `operand_index == 0`), recursively splitting sub-chains at the optimal
+        split points recorded in `splits`.
+        """
+        if index_l == index_r:
+            if index_l == operand_index:
+                return operand
+            return self._matrices[
+                index_l - 1 if operand_index == 0 else index_l]
+        split = splits[index_l, index_r]
+        product_l = self._evaluate_chain(
+            splits, index_l, split, operand, operand_index)
+        product_r = self._evaluate_chain(
+            splits, split + 1, index_r, operand, operand_index)
+        if isinstance(product_l, Matrix):
+            if isinstance(product_r, Matrix):
+                product_r = product_r.array
+            elif product_r.ndim == 1:
+                return _matrix_vector_multiply(product_l, product_r)
+            return product_l._left_matrix_multiply(product_r)
+        elif isinstance(product_r, Matrix):
+            if product_l.ndim == 1:
+                return _vector_matrix_multiply(product_l, product_r)
+            return product_r._right_matrix_multiply(product_l)
+        return product_l @ product_r
+
     def _left_matrix_multiply(self, other):
-        for matrix in reversed(self.matrices):
-            other = matrix @ other
-        return other
+        if self._chain_dims is None or len(self._matrices) == 1:
+            if other.ndim == 1:
+                for matrix in reversed(self.matrices):
+                    other = _matrix_vector_multiply(matrix, other)
+            else:
+                for matrix in reversed(self.matrices):
+                    other = matrix @ other
+            return other
+        dims = self._chain_dims + (
+            other.shape[1] if other.ndim == 2 else 1,)
+        splits = _matrix_chain_splits(dims)
+        return self._evaluate_chain(
+            splits, 0, len(self._matrices), other, len(self._matrices))
 
     def _right_matrix_multiply(self, other):
-        for matrix in self.matrices:
-            other = other @ matrix
-        return other
+        if self._chain_dims is None or len(self._matrices) == 1:
+            if other.ndim == 1:
+                for matrix in self.matrices:
+                    other = _vector_matrix_multiply(other, matrix)
+            else:
+                for matrix in self.matrices:
+                    other = other @ matrix
+            return other
+        dims = (other.shape[0] if other.ndim == 2 else 1,) + self._chain_dims
+        splits = _matrix_chain_splits(dims)
+        return self._evaluate_chain(splits, 0, len(self._matrices), other, 0)
 
     @property
     def T(self):
@@ -243,6 +572,8 @@ class MatrixProduct(ImplicitArrayMatrix):
             tuple(matrix.T for matrix in reversed(self.matrices)))
 
     def _construct_array(self):
+        if len(self.matrices) == 1:
+            return self.matrices[0].array
         return self.matrices[0].array @ MatrixProduct(self.matrices[1:])
 
 
@@ -328,10 +659,16 @@ class SymmetricMatrix(SquareMatrix):
     def __init__(self, shape):
         self._eigval = None
         self._eigvec = None
+        self._inv = None
+        self._sqrt = None
+        self._log_abs_det = None
         super().__init__(shape)
 
     def _compute_eigendecomposition(self):
-        self._eigval, eigvec = nla.eigh(self.array)
+        # MRRR ('evr') driver is typically the fastest LAPACK symmetric
+        # eigensolver for medium sized matrices
+        self._eigval, eigvec = sla.eigh(
+            self.array, driver='evr', check_finite=False)
         self._eigvec = OrthogonalMatrix(eigvec)
 
     @property
@@ -354,7 +691,11 @@ class SymmetricMatrix(SquareMatrix):
 
     @property
     def log_abs_det(self):
-        return np.log(np.abs(self.eigval)).sum()
+        if self._log_abs_det is None:
+            abs_eigval = np.abs(self.eigval)
+            np.log(abs_eigval, out=abs_eigval)
+            self._log_abs_det = abs_eigval.sum()
+        return self._log_abs_det
 
 
 class SymmetricInvertibleMatrix(SymmetricMatrix, InvertibleMatrix):
@@ -391,6 +732,7 @@ class IdentityMatrix(PositiveDefiniteMatrix, ImplicitArrayMatrix):
                 matrix is to be implicitly shaped.
         """
         super().__init__((size, size))
+        self._diagonal = None
 
     def _scalar_multiply(self, scalar):
         if scalar > 0:
@@ -423,7 +765,13 @@ class IdentityMatrix(PositiveDefiniteMatrix, ImplicitArrayMatrix):
 
     @property
     def diagonal(self):
-        return np.ones(self.shape[0])
+        if self._diagonal is None:
+            if self.shape[0] is None:
+                return np.ones(self.shape[0])
+            # Read-only zero-stride view avoids a fresh length-N allocation
+            # on each access
+            self._diagonal = np.broadcast_to(1., (self.shape[0],))
+        return self._diagonal
 
     def _construct_array(self):
         if self.shape[0] is None:
@@ -437,6 +785,23 @@ class IdentityMatrix(PositiveDefiniteMatrix, ImplicitArrayMatrix):
         return 0.
 
 
+@lru_cache(maxsize=32)
+def _identity_matrix_of_dim(dim):
+    """Get a shared `IdentityMatrix` instance of a given dimension.
+
+    Identity matrices are immutable so instances can be safely shared, and
+    caching by dimension avoids repeatedly allocating fresh objects at call
+    sites which construct an identity of the same size on every invocation.
+
+    Args:
+        dim (int): Dimension of identity matrix.
+
+    Returns:
+        identity_matrix (IdentityMatrix): Shared instance for dimension.
+    """
+    return IdentityMatrix(dim)
+
+
 class DifferentiableMatrix(InvertibleMatrix):
     """Parameterically defined matrix defining gradient of scalar operations.
 
@@ -499,6 +864,7 @@ class ScaledIdentityMatrix(
             raise ValueError('scalar must be non-zero')
         self._scalar = scalar
         super().__init__((size, size))
+        self._diagonal = None
 
     def _scalar_multiply(self, scalar):
         return ScaledIdentityMatrix(scalar * self._scalar, self.shape[0])
@@ -523,14 +889,23 @@ class ScaledIdentityMatrix(
 
     @property
     def diagonal(self):
-        return self._scalar * np.ones(self.shape[0])
+        if self._diagonal is None:
+            if self.shape[0] is None:
+                return self._scalar * np.ones(self.shape[0])
+            # Read-only zero-stride view avoids a fresh length-N allocation
+            # on each access
+            self._diagonal = np.broadcast_to(
+                self._scalar, (self.shape[0],))
+        return self._diagonal
 
     def _construct_array(self):
         if self.shape[0] is None:
             raise RuntimeError(
                 'Cannot get array representation for scaled identity matrix '
                 'with implicit size.')
-        return self._scalar * np.identity(self.shape[0])
+        array = np.zeros((self.shape[0], self.shape[0]))
+        np.fill_diagonal(array, self._scalar)
+        return array
 
     @property
     def log_abs_det(self):
@@ -602,7 +977,12 @@ class DiagonalMatrix(
 
     def _left_matrix_multiply(self, other):
         if other.ndim == 2:
-            return self.diagonal[:, None] * other
+            diagonal = self.diagonal[:, None]
+            if NUMEXPR_AVAILABLE and other.size >= NUMEXPR_SIZE_THRESHOLD:
+                return numexpr.evaluate(
+                    'diagonal * other',
+                    {'diagonal': diagonal, 'other': other})
+            return diagonal * other
         elif other.ndim == 1:
             return self.diagonal * other
         else:
@@ -611,6 +991,11 @@ class DiagonalMatrix(
                 'dimensional right hand sides.')
 
     def _right_matrix_multiply(self, other):
+        if (NUMEXPR_AVAILABLE and other.ndim == 2 and
+                other.size >= NUMEXPR_SIZE_THRESHOLD):
+            diagonal = self.diagonal
+            return numexpr.evaluate(
+                'other * diagonal', {'diagonal': diagonal, 'other': other})
         return self.diagonal * other
 
     @property
@@ -676,7 +1061,10 @@ class TriangularMatrix(InvertibleMatrix, ExplicitArrayMatrix):
                 upper-triangular (`False`).
         """
         super().__init__(array.shape)
-        self._array = np.tril(array) if lower else np.triu(array)
+        # Store in Fortran (column-major) order so that LAPACK routines
+        # acting on the array can do so without an internal copy
+        self._array = np.asfortranarray(
+            np.tril(array) if lower else np.triu(array))
         self.lower = lower
 
     def _scalar_multiply(self, scalar):
@@ -692,7 +1080,9 @@ class TriangularMatrix(InvertibleMatrix, ExplicitArrayMatrix):
 
     @property
     def log_abs_det(self):
-        return np.log(np.abs(self.diagonal)).sum()
+        abs_diagonal = np.abs(self.diagonal)
+        np.log(abs_diagonal, out=abs_diagonal)
+        return abs_diagonal.sum()
 
     def __str__(self):
         return f'(shape={self.shape}, lower={self.lower})'
@@ -713,7 +1103,9 @@ class InverseTriangularMatrix(InvertibleMatrix, ImplicitArrayMatrix):
                 upper-triangular (`False`).
         """
         super().__init__(inverse_array.shape)
-        self._inverse_array = inverse_array
+        # Store in Fortran (column-major) order so that the triangular solves
+        # against the array can run without an internal copy
+        self._inverse_array = np.asfortranarray(inverse_array)
         self.lower = lower
 
     def _scalar_multiply(self, scalar):
@@ -722,11 +1114,12 @@ class InverseTriangularMatrix(InvertibleMatrix, ImplicitArrayMatrix):
 
     def _left_matrix_multiply(self, other):
         return sla.solve_triangular(
-            self._inverse_array, other, lower=self.lower)
+            self._inverse_array, other, lower=self.lower, check_finite=False)
 
     def _right_matrix_multiply(self, other):
         return sla.solve_triangular(
-            self._inverse_array, other.T, lower=self.lower, trans=1).T
+            self._inverse_array, other.T, lower=self.lower, trans=1,
+            check_finite=False).T
 
     @property
     def inv(self):
@@ -738,7 +1131,13 @@ class InverseTriangularMatrix(InvertibleMatrix, ImplicitArrayMatrix):
             self._inverse_array.T, lower=not self.lower)
 
     def _construct_array(self):
-        return self @ np.identity(self.shape[0])
+        trtri = sla.get_lapack_funcs('trtri', (self._inverse_array,))
+        array, info = trtri(self._inverse_array, lower=self.lower)
+        if info != 0:
+            raise sla.LinAlgError(
+                'Triangular matrix inversion failed: input matrix is '
+                'singular.')
+        return np.tril(array) if self.lower else np.triu(array)
 
     @property
     def diagonal(self):
@@ -767,12 +1166,16 @@ class _BaseTriangularFactoredDefiniteMatrix(SymmetricMatrix, InvertibleMatrix):
 
     @property
     def inv(self):
-        return TriangularFactoredDefiniteMatrix(
-            factor=self.factor.inv.T, sign=self._sign)
+        if self._inv is None:
+            self._inv = TriangularFactoredDefiniteMatrix(
+                factor=self.factor.inv.T, sign=self._sign)
+        return self._inv
 
     @property
     def log_abs_det(self):
-        return 2 * self.factor.log_abs_det
+        if self._log_abs_det is None:
+            self._log_abs_det = 2 * self.factor.log_abs_det
+        return self._log_abs_det
 
     def __str__(self):
         return f'(shape={self.shape}, sign={self._sign})'
@@ -826,18 +1229,46 @@ class TriangularFactoredDefiniteMatrix(
             sign=self._sign * np.sign(scalar))
 
     def _left_matrix_multiply(self, other):
-        return self._sign * (self.factor @ (self.factor.T @ other))
+        factor = self.factor
+        if (_fast_kernels.NUMBA_AVAILABLE and other.ndim == 1 and
+                other.shape[0] <= NUMBA_MATVEC_SIZE_THRESHOLD and
+                isinstance(factor, TriangularMatrix) and
+                factor.array.dtype == np.float64 and
+                other.dtype == np.float64):
+            return _fast_kernels.tri_factored_matvec(
+                factor.array, other, float(self._sign), factor.lower)
+        if isinstance(factor, InverseTriangularMatrix):
+            # Perform the two triangular solves directly, reusing the
+            # intermediate buffer from the first solve for the second
+            result = sla.solve_triangular(
+                factor._inverse_array, other, lower=factor.lower, trans=1,
+                check_finite=False)
+            result = sla.solve_triangular(
+                factor._inverse_array, result, lower=factor.lower,
+                overwrite_b=True, check_finite=False)
+        else:
+            result = factor @ (factor.T @ other)
+        if self._sign != 1:
+            np.multiply(result, self._sign, out=result)
+        return result
 
     def _right_matrix_multiply(self, other):
-        return self._sign * ((other @ self.factor) @ self.factor.T)
+        result = (other @ self.factor) @ self.factor.T
+        if self._sign != 1:
+            np.multiply(result, self._sign, out=result)
+        return result
 
     @property
     def grad_log_abs_det(self):
-        return np.diag(2 / self.factor.diagonal)
+        return DiagonalMatrix(2 / self.factor.diagonal)
 
     def grad_quadratic_form_inv(self, vector):
         inv_factor_vector = self.factor.inv @ vector
         inv_vector = self.inv @ vector
+        if _fast_kernels.NUMBA_AVAILABLE:
+            return _fast_kernels.scaled_triangular_outer(
+                inv_vector, inv_factor_vector, -2. * self._sign,
+                self.factor.lower)
         if self.factor.lower:
             return -2 * self._sign * np.tril(
                 np.outer(inv_vector, inv_factor_vector))
@@ -846,7 +1277,13 @@ class TriangularFactoredDefiniteMatrix(
                 np.outer(inv_vector, inv_factor_vector))
 
     def _construct_array(self):
-        return self._sign * (self.factor @ self.factor.array.T)
+        factor_array = self.factor.array
+        syrk = sla.get_blas_funcs('syrk', (factor_array,))
+        # syrk computes sign * factor @ factor.T writing only the lower
+        # triangle of the (symmetric) result, which is then reflected
+        product = syrk(alpha=self._sign, a=factor_array, lower=1)
+        product += np.tril(product, -1).T
+        return product
 
 
 class TriangularFactoredPositiveDefiniteMatrix(
@@ -888,8 +1325,10 @@ class TriangularFactoredPositiveDefiniteMatrix(
 
     @property
     def inv(self):
-        return TriangularFactoredPositiveDefiniteMatrix(
-            factor=self.factor.inv.T)
+        if self._inv is None:
+            self._inv = TriangularFactoredPositiveDefiniteMatrix(
+                factor=self.factor.inv.T)
+        return self._inv
 
     @property
     def sqrt(self):
@@ -900,7 +1339,7 @@ class DenseDefiniteMatrix(_BaseTriangularFactoredDefiniteMatrix,
                           DifferentiableMatrix, ExplicitArrayMatrix):
     """Definite matrix specified by a dense 2D array."""
 
-    def __init__(self, array, factor=None, is_posdef=True):
+    def __init__(self, array, factor=None, is_posdef=True, dtype=None):
         """
         Args:
             array (array): 2D array specifying matrix entries.
@@ -918,10 +1357,18 @@ class DenseDefiniteMatrix(_BaseTriangularFactoredDefiniteMatrix,
                 definite and `is_posdef` is `False` (`True`) then a
                 `LinAlgError` exception will be if a later attempt is made to
                 factorise the matrix.
+            dtype (None or dtype): Optional data type to store the matrix
+                entries as, for example `numpy.float32` to use a reduced
+                precision representation which halves the memory traffic of
+                the factorisation and subsequent solves at the cost of
+                reduced accuracy. If `None` the data type of `array` is used.
         """
         super().__init__(array.shape[0], sign=1 if is_posdef else -1)
+        if dtype is not None:
+            array = array.astype(dtype, copy=False)
         self._array = array
         self._factor = factor
+        self._inv_array = None
 
     def _scalar_multiply(self, scalar):
         if (scalar > 0) == (self._sign == 1):
@@ -938,23 +1385,59 @@ class DenseDefiniteMatrix(_BaseTriangularFactoredDefiniteMatrix,
     @property
     def factor(self):
         if self._factor is None:
+            # Copy in to a Fortran-ordered buffer which the factorisation is
+            # allowed to overwrite, negating in place for the negative
+            # definite case, so that no further internal copy is made
+            buffer = np.array(self._array, order='F')
+            if self._sign == -1:
+                np.negative(buffer, out=buffer)
             self._factor = TriangularMatrix(
-                nla.cholesky(self._sign * self._array), lower=True)
+                sla.cholesky(
+                    buffer, lower=True, overwrite_a=True,
+                    check_finite=False),
+                lower=True)
         return self._factor
 
+    def _solve_via_factor(self, rhs):
+        """Solve `sign * factor @ factor.T @ x = rhs` for `x`.
+
+        Uses a Cholesky-based solve against the triangular factorisation of
+        the matrix rather than materialising the product of the inverted
+        factors.
+        """
+        factor_array = self.factor.array
+        if self.factor.lower:
+            solution = sla.cho_solve((factor_array, True), rhs)
+        else:
+            solution = sla.solve_triangular(
+                factor_array,
+                sla.solve_triangular(factor_array, rhs, lower=False),
+                lower=False, trans=1)
+        if self._sign != 1:
+            np.multiply(solution, self._sign, out=solution)
+        return solution
+
+    @property
+    def _inverse_array(self):
+        """Explicit 2D array representation of inverse of matrix."""
+        if self._inv_array is None:
+            self._inv_array = self._solve_via_factor(
+                np.identity(self.shape[0]))
+        return self._inv_array
+
     @property
     def grad_log_abs_det(self):
-        return self.inv.array
+        return self._inverse_array
 
     def grad_quadratic_form_inv(self, vector):
-        inv_matrix_vector = self.inv @ vector
+        inv_matrix_vector = self._solve_via_factor(vector)
         return -np.outer(inv_matrix_vector, inv_matrix_vector)
 
 
 class DensePositiveDefiniteMatrix(DenseDefiniteMatrix, PositiveDefiniteMatrix):
     """Positive-definite matrix specified by a dense 2D array."""
 
-    def __init__(self, array, factor=None):
+    def __init__(self, array, factor=None, dtype=None):
         """
         Args:
             array (array): 2D array specifying matrix entries.
@@ -964,13 +1447,20 @@ class DensePositiveDefiniteMatrix(DenseDefiniteMatrix, PositiveDefiniteMatrix):
                 pre-computed and specified at initialisation a factorisation
                 will only be computed when first required by an operation which
                 depends on the factor.
+            dtype (None or dtype): Optional data type to store the matrix
+                entries as, for example `numpy.float32` to use a reduced
+                precision representation. If `None` the data type of `array`
+                is used.
         """
-        super().__init__(array=array, factor=factor, is_posdef=True)
+        super().__init__(
+            array=array, factor=factor, is_posdef=True, dtype=dtype)
 
     @property
     def inv(self):
-        return TriangularFactoredPositiveDefiniteMatrix(
-            factor=self.factor.inv.T)
+        if self._inv is None:
+            self._inv = TriangularFactoredPositiveDefiniteMatrix(
+                factor=self.factor.inv.T)
+        return self._inv
 
     @property
     def sqrt(self):
@@ -1010,7 +1500,28 @@ class DensePositiveDefiniteProductMatrix(DensePositiveDefiniteMatrix):
         if pos_def_matrix is None:
             pos_def_matrix = IdentityMatrix(rect_matrix.shape[1])
         self._pos_def_matrix = pos_def_matrix
-        _array = rect_matrix @ (pos_def_matrix @ rect_matrix.T.array)
+        rect_array = rect_matrix.array
+        if isinstance(
+                pos_def_matrix, (IdentityMatrix, PositiveScaledIdentityMatrix)):
+            # rect_matrix @ rect_matrix.T is a symmetric rank-k update which
+            # syrk computes at half the flops of a general matrix product,
+            # filling only the lower triangle which is then mirrored, with any
+            # scaled identity inner matrix folded into the update coefficient
+            alpha = (
+                1. if isinstance(pos_def_matrix, IdentityMatrix)
+                else pos_def_matrix._scalar)
+            syrk = sla.get_blas_funcs('syrk', (rect_array,))
+            _array = syrk(alpha, rect_array, lower=1)
+            _array += np.tril(_array, -1).T
+        elif isinstance(pos_def_matrix, DensePositiveDefiniteMatrix):
+            # symm reads only one triangle of the symmetric inner matrix and
+            # the transposed right factor enters the final product as a view
+            # rather than a materialised copy
+            symm = sla.get_blas_funcs('symm', (rect_array,))
+            _array = symm(
+                1., pos_def_matrix.array, rect_array, side=1) @ rect_array.T
+        else:
+            _array = rect_matrix @ (pos_def_matrix @ rect_array.T)
         super().__init__(_array)
 
     @property
@@ -1020,9 +1531,12 @@ class DensePositiveDefiniteProductMatrix(DensePositiveDefiniteMatrix):
 
     def grad_quadratic_form_inv(self, vector):
         inv_matrix_vector = self.inv @ vector
-        return -2 * np.outer(
-            inv_matrix_vector,
-            self._pos_def_matrix @ (self._rect_matrix.T @ inv_matrix_vector))
+        product_vector = self._pos_def_matrix @ (
+            self._rect_matrix.T @ inv_matrix_vector)
+        # ger fuses the scalar multiplier into the rank-1 outer product,
+        # avoiding a separate scaled copy of the outer product array
+        ger = sla.get_blas_funcs('ger', (inv_matrix_vector, product_vector))
+        return ger(-2., inv_matrix_vector, product_vector)
 
 
 class DenseSquareMatrix(InvertibleMatrix, ExplicitArrayMatrix):
@@ -1046,6 +1560,9 @@ class DenseSquareMatrix(InvertibleMatrix, ExplicitArrayMatrix):
         self._array = array
         self._lu_and_piv = lu_and_piv
         self._lu_transposed = lu_transposed
+        self._log_abs_det = None
+        self._transpose = None
+        self._inv = None
 
     def _scalar_multiply(self, scalar):
         if self._lu_and_piv is None or self._lu_transposed is None:
@@ -1053,7 +1570,10 @@ class DenseSquareMatrix(InvertibleMatrix, ExplicitArrayMatrix):
         else:
             old_lu, piv = self._lu_and_piv
             # Multiply upper-triangle by scalar
-            new_lu = old_lu + (scalar - 1) * np.triu(old_lu)
+            if _fast_kernels.NUMBA_AVAILABLE:
+                new_lu = _fast_kernels.scale_upper_triangle(old_lu, scalar)
+            else:
+                new_lu = old_lu + (scalar - 1) * np.triu(old_lu)
             return DenseSquareMatrix(
                 scalar * self._array, (new_lu, piv), self._lu_transposed)
 
@@ -1061,26 +1581,40 @@ class DenseSquareMatrix(InvertibleMatrix, ExplicitArrayMatrix):
     def lu_and_piv(self):
         """Pivoted LU factorisation of matrix."""
         if self._lu_and_piv is None:
-            self._lu_and_piv = sla.lu_factor(self._array)
+            getrf = sla.get_lapack_funcs('getrf', (self._array,))
+            lu, piv, info = getrf(self._array)
+            if info < 0:
+                raise sla.LinAlgError(
+                    f'Internal getrf call failed with status code {info}.')
+            self._lu_and_piv = (lu, piv)
             self._lu_transposed = False
         return self._lu_and_piv
 
     @property
     def log_abs_det(self):
-        lu, piv = self.lu_and_piv
-        return np.log(np.abs(lu.diagonal())).sum()
+        if self._log_abs_det is None:
+            lu, piv = self.lu_and_piv
+            if _fast_kernels.NUMBA_AVAILABLE:
+                self._log_abs_det = _fast_kernels.log_abs_det_from_lu_diag(lu)
+            else:
+                abs_diagonal = np.abs(lu.diagonal())
+                np.log(abs_diagonal, out=abs_diagonal)
+                self._log_abs_det = abs_diagonal.sum()
+        return self._log_abs_det
 
     @property
     def T(self):
-        lu_and_piv = self.lu_and_piv
-        return DenseSquareMatrix(
-            self._array.T, lu_and_piv, not self._lu_transposed)
+        if self._transpose is None:
+            self._transpose = DenseSquareMatrix(
+                self._array.T, self.lu_and_piv, not self._lu_transposed)
+        return self._transpose
 
     @property
     def inv(self):
-        lu_and_piv = self.lu_and_piv
-        return InverseLUFactoredSquareMatrix(
-            self._array, lu_and_piv, self._lu_transposed)
+        if self._inv is None:
+            self._inv = InverseLUFactoredSquareMatrix(
+                self._array, self.lu_and_piv, self._lu_transposed)
+        return self._inv
 
 
 class InverseLUFactoredSquareMatrix(InvertibleMatrix, ImplicitArrayMatrix):
@@ -1104,40 +1638,87 @@ class InverseLUFactoredSquareMatrix(InvertibleMatrix, ImplicitArrayMatrix):
         self._inv_array = inv_array
         self._inv_lu_and_piv = inv_lu_and_piv
         self._inv_lu_transposed = inv_lu_transposed
+        self._log_abs_det = None
+        self._transpose = None
+        self._inv = None
 
     def _scalar_multiply(self, scalar):
         old_inv_lu, piv = self._inv_lu_and_piv
         # Divide upper-triangle by scalar
-        new_inv_lu = old_inv_lu - (scalar - 1) / scalar * np.triu(old_inv_lu)
+        if _fast_kernels.NUMBA_AVAILABLE:
+            new_inv_lu = _fast_kernels.scale_upper_triangle(
+                old_inv_lu, 1 / scalar)
+        else:
+            new_inv_lu = (
+                old_inv_lu - (scalar - 1) / scalar * np.triu(old_inv_lu))
         return InverseLUFactoredSquareMatrix(
             self._inv_array / scalar, (new_inv_lu, piv),
             self._inv_lu_transposed)
 
     def _left_matrix_multiply(self, other):
-        return sla.lu_solve(
-            self._inv_lu_and_piv, other, self._inv_lu_transposed)
+        # Module-level memoised routine lookup avoids the repeated function
+        # resolution and dtype dispatch overhead of scipy.linalg.lu_solve on
+        # every multiplication
+        getrs = _lapack_getrs_for_dtype(self._inv_lu_and_piv[0].dtype)
+        solution, info = getrs(
+            self._inv_lu_and_piv[0], self._inv_lu_and_piv[1], other,
+            trans=int(self._inv_lu_transposed))
+        if info != 0:
+            raise sla.LinAlgError(
+                f'Internal getrs call failed with status code {info}.')
+        return solution
 
     def _right_matrix_multiply(self, other):
-        return sla.lu_solve(
-            self._inv_lu_and_piv, other.T, not self._inv_lu_transposed).T
+        getrs = _lapack_getrs_for_dtype(self._inv_lu_and_piv[0].dtype)
+        solution, info = getrs(
+            self._inv_lu_and_piv[0], self._inv_lu_and_piv[1], other.T,
+            trans=int(not self._inv_lu_transposed))
+        if info != 0:
+            raise sla.LinAlgError(
+                f'Internal getrs call failed with status code {info}.')
+        return solution.T
 
     @property
     def log_abs_det(self):
-        return -np.log(np.abs(self._inv_lu_and_piv[0].diagonal())).sum()
+        if self._log_abs_det is None:
+            if _fast_kernels.NUMBA_AVAILABLE:
+                self._log_abs_det = -_fast_kernels.log_abs_det_from_lu_diag(
+                    self._inv_lu_and_piv[0])
+            else:
+                abs_diagonal = np.abs(self._inv_lu_and_piv[0].diagonal())
+                np.log(abs_diagonal, out=abs_diagonal)
+                self._log_abs_det = -abs_diagonal.sum()
+        return self._log_abs_det
 
     def _construct_array(self):
-        return self @ np.identity(self.shape[0])
+        lu, piv = self._inv_lu_and_piv
+        getri, getri_lwork = sla.get_lapack_funcs(
+            ('getri', 'getri_lwork'), (lu,))
+        # Workspace query returns the optimal blocked workspace size for this
+        # dimension, letting getri use its BLAS-3 blocked algorithm rather
+        # than the unblocked fallback forced by a minimal workspace
+        lwork, info = getri_lwork(lu.shape[0])
+        array, info = getri(lu, piv, lwork=int(lwork), overwrite_lu=False)
+        if info != 0:
+            raise sla.LinAlgError(
+                f'Internal getri call failed with status code {info}.')
+        return array.T if self._inv_lu_transposed else array
 
     @property
     def inv(self):
-        return DenseSquareMatrix(
-            self._inv_array, self._inv_lu_and_piv, self._inv_lu_transposed)
+        if self._inv is None:
+            self._inv = DenseSquareMatrix(
+                self._inv_array, self._inv_lu_and_piv,
+                self._inv_lu_transposed)
+        return self._inv
 
     @property
     def T(self):
-        return InverseLUFactoredSquareMatrix(
-            self._inv_array.T, self._inv_lu_and_piv,
-            not self._inv_lu_transposed)
+        if self._transpose is None:
+            self._transpose = InverseLUFactoredSquareMatrix(
+                self._inv_array.T, self._inv_lu_and_piv,
+                not self._inv_lu_transposed)
+        return self._transpose
 
 
 class DenseSymmetricMatrix(
@@ -1172,7 +1753,24 @@ class DenseSymmetricMatrix(
 
     @property
     def inv(self):
-        return EigendecomposedSymmetricMatrix(self.eigvec, 1 / self.eigval)
+        if self._inv is None:
+            if self._eigval is None:
+                # Attempt a Cholesky factorisation first as it is an order of
+                # magnitude cheaper than the eigendecomposition fallback and
+                # succeeds in the common case of the matrix being positive
+                # definite
+                try:
+                    factor = sla.cholesky(
+                        self._array, lower=True, check_finite=False)
+                    self._inv = TriangularFactoredPositiveDefiniteMatrix(
+                        TriangularMatrix(factor, lower=True)).inv
+                except sla.LinAlgError:
+                    self._inv = EigendecomposedSymmetricMatrix(
+                        self.eigvec, 1 / self.eigval)
+            else:
+                self._inv = EigendecomposedSymmetricMatrix(
+                    self.eigvec, 1 / self.eigval)
+        return self._inv
 
 
 class OrthogonalMatrix(InvertibleMatrix, ExplicitArrayMatrix):
@@ -1185,6 +1783,7 @@ class OrthogonalMatrix(InvertibleMatrix, ExplicitArrayMatrix):
         """
         super().__init__(array.shape)
         self._array = array
+        self._transpose = None
 
     def _scalar_multiply(self, scalar):
         return ScaledOrthogonalMatrix(scalar, self.array)
@@ -1195,7 +1794,12 @@ class OrthogonalMatrix(InvertibleMatrix, ExplicitArrayMatrix):
 
     @property
     def T(self):
-        return OrthogonalMatrix(self.array.T)
+        if self._transpose is None:
+            self._transpose = OrthogonalMatrix(self.array.T)
+            # Transposing twice returns the original wrapper so repeated
+            # round trips on the hot path construct no new objects
+            self._transpose._transpose = self
+        return self._transpose
 
     @property
     def inv(self):
@@ -1222,6 +1826,8 @@ class ScaledOrthogonalMatrix(InvertibleMatrix, ImplicitArrayMatrix):
         super().__init__(orth_array.shape)
         self._scalar = scalar
         self._orth_array = orth_array
+        self._transpose = None
+        self._inv = None
 
     def _left_matrix_multiply(self, other):
         return self._scalar * (self._orth_array @ other)
@@ -1245,11 +1851,18 @@ class ScaledOrthogonalMatrix(InvertibleMatrix, ImplicitArrayMatrix):
 
     @property
     def T(self):
-        return ScaledOrthogonalMatrix(self._scalar, self._orth_array.T)
+        if self._transpose is None:
+            self._transpose = ScaledOrthogonalMatrix(
+                self._scalar, self._orth_array.T)
+            self._transpose._transpose = self
+        return self._transpose
 
     @property
     def inv(self):
-        return ScaledOrthogonalMatrix(1 / self._scalar, self._orth_array.T)
+        if self._inv is None:
+            self._inv = ScaledOrthogonalMatrix(
+                1 / self._scalar, self._orth_array.T)
+        return self._inv
 
 
 class EigendecomposedSymmetricMatrix(
@@ -1277,35 +1890,80 @@ class EigendecomposedSymmetricMatrix(
                 with column `i` of `eigvec`.
         """
         if isinstance(eigvec, np.ndarray):
-            eigvec = OrthogonalMatrix(eigvec)
-        super().__init__(eigvec.shape)
+            # Defer wrapping the array in an OrthogonalMatrix until the
+            # eigvec property is externally accessed - the multiplication
+            # fast paths below only need the raw array
+            eigvec_array = eigvec
+            eigvec = None
+        elif isinstance(eigvec, OrthogonalMatrix):
+            eigvec_array = eigvec.array
+        else:
+            eigvec_array = None
+        super().__init__(
+            eigvec.shape if eigvec is not None else eigvec_array.shape)
         self._eigvec = eigvec
+        self._eigvec_array = eigvec_array
         self._eigval = eigval
         if not isinstance(eigval, np.ndarray) or eigval.size == 1:
             self.diag_eigval = ScaledIdentityMatrix(eigval)
         else:
             self.diag_eigval = DiagonalMatrix(eigval)
 
+    @property
+    def eigval(self):
+        return self._eigval
+
+    @property
+    def eigvec(self):
+        if self._eigvec is None:
+            self._eigvec = OrthogonalMatrix(self._eigvec_array)
+        return self._eigvec
+
     def _scalar_multiply(self, scalar):
         return EigendecomposedSymmetricMatrix(
-            self.eigvec, self.eigval * scalar)
+            self._eigvec_array if self._eigvec is None else self._eigvec,
+            self.eigval * scalar)
 
     def _left_matrix_multiply(self, other):
+        if self._eigvec_array is not None:
+            # Multiply directly with the eigenvector array and its transposed
+            # view, scaling by the eigenvalues in place, to avoid the
+            # transposed wrapper construction and diagonal matrix dispatch of
+            # the generic path on every call
+            tmp = self._eigvec_array.T @ other
+            if isinstance(self._eigval, np.ndarray) and tmp.ndim == 2:
+                tmp *= self._eigval[:, None]
+            else:
+                tmp *= self._eigval
+            return self._eigvec_array @ tmp
         return self.eigvec @ (self.diag_eigval @ (self.eigvec.T @ other))
 
     def _right_matrix_multiply(self, other):
+        if self._eigvec_array is not None:
+            tmp = other @ self._eigvec_array
+            tmp *= self._eigval
+            return tmp @ self._eigvec_array.T
         return ((other @ self.eigvec) @ self.diag_eigval) @ self.eigvec.T
 
     @property
     def inv(self):
-        return EigendecomposedSymmetricMatrix(self.eigvec, 1 / self.eigval)
+        if self._inv is None:
+            self._inv = EigendecomposedSymmetricMatrix(
+                self.eigvec, 1 / self.eigval)
+        return self._inv
 
     def _construct_array(self):
         if self.shape[0] is None:
             raise RuntimeError(
                 'Cannot get array representation for symmetric '
                 'eigendecomposed matrix with implicit size.')
-        return self @ np.identity(self.shape[0])
+        eigvec_array = (
+            self._eigvec_array if self._eigvec_array is not None
+            else self.eigvec.array)
+        # Pre-scaling the eigenvector columns reduces the sandwich product to
+        # a single gemm, with the transpose handled by the BLAS flag for the
+        # strided view rather than a materialised copy
+        return (eigvec_array * self.eigval) @ eigvec_array.T
 
 
 class EigendecomposedPositiveDefiniteMatrix(
@@ -1335,12 +1993,17 @@ class EigendecomposedPositiveDefiniteMatrix(
 
     @property
     def inv(self):
-        return EigendecomposedPositiveDefiniteMatrix(
-            self.eigvec, 1 / self.eigval)
+        if self._inv is None:
+            self._inv = EigendecomposedPositiveDefiniteMatrix(
+                self.eigvec, 1 / self.eigval)
+        return self._inv
 
     @property
     def sqrt(self):
-        return EigendecomposedSymmetricMatrix(self.eigvec, self.eigval**0.5)
+        if self._sqrt is None:
+            self._sqrt = EigendecomposedSymmetricMatrix(
+                self.eigvec, self.eigval**0.5)
+        return self._sqrt
 
 
 class SoftAbsRegularisedPositiveDefiniteMatrix(
@@ -1369,7 +2032,12 @@ class SoftAbsRegularisedPositiveDefiniteMatrix(
             raise ValueError('softabs_coeff must be positive.')
         self._softabs_coeff = softabs_coeff
         self.unreg_eigval, eigvec = nla.eigh(symmetric_array)
-        eigval = self.softabs(self.unreg_eigval)
+        if _fast_kernels.NUMBA_AVAILABLE:
+            eigval, self._grad_softabs_eigval = _fast_kernels.softabs_and_grad(
+                self.unreg_eigval, softabs_coeff)
+        else:
+            eigval = self.softabs(self.unreg_eigval)
+            self._grad_softabs_eigval = None
         super().__init__(eigvec, eigval)
 
     def softabs(self, x):
@@ -1382,20 +2050,31 @@ class SoftAbsRegularisedPositiveDefiniteMatrix(
             1. / np.tanh(self._softabs_coeff * x) -
             self._softabs_coeff * x / np.sinh(self._softabs_coeff * x)**2)
 
+    @property
+    def _softabs_grad_eigval(self):
+        """Derivative of softabs function evaluated at unregularised eigval."""
+        if self._grad_softabs_eigval is None:
+            self._grad_softabs_eigval = self.grad_softabs(self.unreg_eigval)
+        return self._grad_softabs_eigval
+
     @property
     def grad_log_abs_det(self):
-        grad_eigval = self.grad_softabs(self.unreg_eigval) / self.eigval
+        grad_eigval = self._softabs_grad_eigval / self.eigval
         return EigendecomposedSymmetricMatrix(self.eigvec, grad_eigval).array
 
     def grad_quadratic_form_inv(self, vector):
-        num_j_mtx = self.eigval[:, None] - self.eigval[None, :]
-        num_j_mtx += np.diag(self.grad_softabs(self.unreg_eigval))
-        den_j_mtx = self.unreg_eigval[:, None] - self.unreg_eigval[None, :]
-        np.fill_diagonal(den_j_mtx, 1)
-        j_mtx = num_j_mtx / den_j_mtx
         e_vct = (self.eigvec.T @ vector) / self.eigval
-        return -(
-            (self.eigvec @ (np.outer(e_vct, e_vct) * j_mtx)) @ self.eigvec.T)
+        if _fast_kernels.NUMBA_AVAILABLE:
+            inner = _fast_kernels.softabs_grad_quadratic_form_inner(
+                self.eigval, self.unreg_eigval, self._softabs_grad_eigval,
+                e_vct)
+        else:
+            num_j_mtx = self.eigval[:, None] - self.eigval[None, :]
+            num_j_mtx += np.diag(self._softabs_grad_eigval)
+            den_j_mtx = self.unreg_eigval[:, None] - self.unreg_eigval[None, :]
+            np.fill_diagonal(den_j_mtx, 1)
+            inner = np.outer(e_vct, e_vct) * (num_j_mtx / den_j_mtx)
+        return -((self.eigvec @ inner) @ self.eigvec.T)
 
 
 class SquareBlockDiagonalMatrix(InvertibleMatrix, ImplicitArrayMatrix):
@@ -1416,6 +2095,17 @@ class SquareBlockDiagonalMatrix(InvertibleMatrix, ImplicitArrayMatrix):
         super().__init__((total_size, total_size))
         self._sizes = sizes
         self._splits = np.cumsum(sizes[:-1])
+        # Precompute per-block slices to extract views of operands without
+        # the Python-level index arithmetic np.split performs on every call
+        split_points = (0,) + tuple(self._splits) + (total_size,)
+        self._slices = tuple(
+            slice(start, end)
+            for start, end in zip(split_points[:-1], split_points[1:]))
+        self._transpose = None
+        self._sqrt = None
+        self._inv = None
+        self._log_abs_det = None
+        self._diagonal = None
 
     @property
     def blocks(self):
@@ -1424,17 +2114,47 @@ class SquareBlockDiagonalMatrix(InvertibleMatrix, ImplicitArrayMatrix):
 
     def _split(self, other, axis=0):
         assert other.shape[axis] == self.shape[0]
-        return np.split(other, self._splits, axis=axis)
+        if axis == 0:
+            return tuple(other[slc] for slc in self._slices)
+        else:
+            return tuple(other[..., slc] for slc in self._slices)
+
+    def _map_over_blocks(self, multiply_block):
+        # Avoid dispatching to the shared pool from within one of its own
+        # worker threads (e.g. for nested block diagonal matrices) as having
+        # all workers block on subtasks can deadlock the pool
+        in_pool_worker = threading.current_thread().name.startswith(
+            'mici-block-multiply')
+        if len(self._blocks) == 1 or in_pool_worker:
+            for index in range(len(self._blocks)):
+                multiply_block(index)
+        else:
+            pool = _get_block_multiply_pool()
+            list(pool.map(multiply_block, range(len(self._blocks))))
 
     def _left_matrix_multiply(self, other):
-        return np.concatenate(
-            [block @ part for block, part in
-             zip(self._blocks, self._split(other, axis=0))], axis=0)
+        parts = self._split(other, axis=0)
+        out = np.empty(
+            (self.shape[0],) + other.shape[1:],
+            np.promote_types(other.dtype, np.float64))
+
+        def multiply_block(index):
+            out[self._slices[index]] = self._blocks[index] @ parts[index]
+
+        self._map_over_blocks(multiply_block)
+        return out
 
     def _right_matrix_multiply(self, other):
-        return np.concatenate(
-            [part @ block for block, part in
-             zip(self._blocks, self._split(other, axis=-1))], axis=-1)
+        parts = self._split(other, axis=-1)
+        out = np.empty(
+            other.shape[:-1] + (self.shape[1],),
+            np.promote_types(other.dtype, np.float64))
+
+        def multiply_block(index):
+            out[..., self._slices[index]] = parts[index] @ self._blocks[index]
+
+        self._map_over_blocks(multiply_block)
+        return out
 
     def _scalar_multiply(self, scalar):
         return SquareBlockDiagonalMatrix(
@@ -1445,21 +2165,40 @@ class SquareBlockDiagonalMatrix(InvertibleMatrix, ImplicitArrayMatrix):
 
     @property
     def T(self):
-        return SquareBlockDiagonalMatrix(
-            tuple(block.T for block in self._blocks))
+        if self._transpose is None:
+            self._transpose = SquareBlockDiagonalMatrix(
+                tuple(block.T for block in self._blocks))
+        return self._transpose
 
     @property
     def sqrt(self):
-        return SquareBlockDiagonalMatrix(
-            tuple(block.sqrt for block in self._blocks))
+        if self._sqrt is None:
+            self._sqrt = SquareBlockDiagonalMatrix(
+                tuple(block.sqrt for block in self._blocks))
+        return self._sqrt
+
+    @property
+    def diagonal(self):
+        if self._diagonal is None:
+            # Assemble from the block diagonals into a single preallocated
+            # buffer rather than materialising the full dense array as the
+            # generic implementation would
+            out = np.empty(self.shape[0])
+            for block, slc in zip(self._blocks, self._slices):
+                out[slc] = block.diagonal
+            self._diagonal = out
+        return self._diagonal
 
     @property
     def diag(self):
-        return np.concatenate([block.diagonal() for block in self._blocks])
+        return self.diagonal
 
     @property
     def inv(self):
-        return type(self)(tuple(block.inv for block in self._blocks))
+        if self._inv is None:
+            self._inv = type(self)(
+                tuple(block.inv for block in self._blocks))
+        return self._inv
 
     @property
     def eigval(self):
@@ -1472,7 +2211,10 @@ class SquareBlockDiagonalMatrix(InvertibleMatrix, ImplicitArrayMatrix):
 
     @property
     def log_abs_det(self):
-        return sum(block.log_abs_det for block in self._blocks)
+        if self._log_abs_det is None:
+            self._log_abs_det = sum(
+                block.log_abs_det for block in self._blocks)
+        return self._log_abs_det
 
 
 class SymmetricBlockDiagonalMatrix(SquareBlockDiagonalMatrix):
@@ -1535,8 +2277,10 @@ class PositiveDefiniteBlockDiagonalMatrix(
 
     @property
     def sqrt(self):
-        return SquareBlockDiagonalMatrix(
-            tuple(block.sqrt for block in self._blocks))
+        if self._sqrt is None:
+            self._sqrt = SquareBlockDiagonalMatrix(
+                tuple(block.sqrt for block in self._blocks))
+        return self._sqrt
 
     @property
     def grad_log_abs_det(self):
@@ -1601,13 +2345,29 @@ class BlockRowMatrix(ImplicitArrayMatrix):
 
     def _left_matrix_multiply(self, other):
         assert other.shape[0] == self.shape[1]
-        return sum(
-            [block @ part for block, part in
-             zip(self._blocks, np.split(other, self._splits, axis=0))])
+        parts = np.split(other, self._splits, axis=0)
+        # Accumulate per-block products in place into the first fresh partial
+        # sum rather than allocating a full-size temporary per block as sum()
+        # does
+        result = self._blocks[0] @ parts[0]
+        if len(self._blocks) == 1:
+            return result.copy()
+        result = result + self._blocks[1] @ parts[1]
+        for block, part in zip(self._blocks[2:], parts[2:]):
+            result += block @ part
+        return result
 
     def _right_matrix_multiply(self, other):
-        return np.concatenate(
-            [other @ block for block in self._blocks], axis=-1)
+        # Write per-block products directly into a preallocated output to
+        # avoid the second output-sized copy np.concatenate would perform
+        out = np.empty(
+            other.shape[:-1] + (self.shape[1],),
+            np.promote_types(other.dtype, np.float64))
+        offset = 0
+        for block in self._blocks:
+            out[..., offset:offset + block.shape[1]] = other @ block
+            offset += block.shape[1]
+        return out
 
     def _scalar_multiply(self, scalar):
         return BlockRowMatrix(
@@ -1647,14 +2407,25 @@ class BlockColumnMatrix(ImplicitArrayMatrix):
         return self._blocks
 
     def _left_matrix_multiply(self, other):
-        return np.concatenate(
-            [block @ other for block in self._blocks], axis=0)
+        out = np.empty(
+            (self.shape[0],) + other.shape[1:],
+            np.promote_types(other.dtype, np.float64))
+        offset = 0
+        for block in self._blocks:
+            out[offset:offset + block.shape[0]] = block @ other
+            offset += block.shape[0]
+        return out
 
     def _right_matrix_multiply(self, other):
         assert other.shape[-1] == self.shape[0]
-        return sum(
-            [part @ block for block, part in
-             zip(self._blocks, np.split(other, self._splits, axis=-1))])
+        parts = np.split(other, self._splits, axis=-1)
+        result = parts[0] @ self._blocks[0]
+        if len(self._blocks) == 1:
+            return result.copy()
+        result = result + parts[1] @ self._blocks[1]
+        for block, part in zip(self._blocks[2:], parts[2:]):
+            result += part @ block
+        return result
 
     def _scalar_multiply(self, scalar):
         return BlockColumnMatrix(
@@ -1692,6 +2463,12 @@ class SquareLowRankUpdateMatrix(InvertibleMatrix, ImplicitArrayMatrix):
     instances with special structure such as diagonality or with an existing
     factorisation, will typically be cheaper than the `O(dim_outer**3)` cost
     of evaluating the inverse or determinant directly.
+
+    Multiplication with vectors and matrices similarly applies the component
+    matrices in sequence at `O(dim_inner * dim_outer)` cost per vector
+    rather than constructing the dense array representation, with the
+    inverse returned as another low-rank update matrix which multiplies the
+    same way.
     """
 
     def __init__(self, left_factor_matrix, right_factor_matrix, square_matrix,
@@ -1743,20 +2520,46 @@ class SquareLowRankUpdateMatrix(InvertibleMatrix, ImplicitArrayMatrix):
         self.inner_square_matrix = inner_square_matrix
         self._capacitance_matrix = capacitance_matrix
         self._sign = sign
+        self._inv = None
+        self._log_abs_det = None
+        self._diagonal = None
+        self._inner_is_identity = isinstance(
+            inner_square_matrix, IdentityMatrix)
+        self._is_rank_1 = dim_inner == 1
+        if self._is_rank_1:
+            self._rank_1_scalar = sign * float(
+                np.asarray(inner_square_matrix @ np.ones(1))[0])
         super().__init__((dim_outer, dim_outer))
 
     def _left_matrix_multiply(self, other):
+        if self._is_rank_1:
+            # For rank-1 updates the factor products reduce to a dot product
+            # and scaled outer product with the factor vectors, avoiding
+            # three separate matrix multiply dispatches
+            left_vector = self.left_factor_matrix.array.ravel()
+            right_vector = self.right_factor_matrix.array.ravel()
+            return self.square_matrix @ other + np.multiply.outer(
+                left_vector, self._rank_1_scalar * (right_vector @ other))
         return self.square_matrix @ other + (
             self._sign * self.left_factor_matrix @ (
                 self.inner_square_matrix @ (self.right_factor_matrix @ other)))
 
     def _right_matrix_multiply(self, other):
+        if self._is_rank_1:
+            left_vector = self.left_factor_matrix.array.ravel()
+            right_vector = self.right_factor_matrix.array.ravel()
+            return other @ self.square_matrix + np.multiply.outer(
+                self._rank_1_scalar * (other @ left_vector), right_vector)
         return other @ self.square_matrix + (
             self._sign * (
                 other @ self.left_factor_matrix) @ self.inner_square_matrix
             ) @ self.right_factor_matrix
 
     def _scalar_multiply(self, scalar):
+        # Scaling of the component matrices dispatches to their own
+        # _scalar_multiply implementations, so structured components such as
+        # identity, scaled identity and diagonal matrices are rescaled
+        # lazily in O(1) or O(dim) without materialising any dense arrays
         return type(self)(
             self.left_factor_matrix, self.right_factor_matrix,
             scalar * self.square_matrix, scalar * self.inner_square_matrix,
@@ -1764,24 +2567,65 @@ class SquareLowRankUpdateMatrix(InvertibleMatrix, ImplicitArrayMatrix):
             if self._capacitance_matrix is not None else None, self._sign)
 
     def _construct_array(self):
-        return self.square_matrix.array + (
-            self._sign * self.left_factor_matrix @ (
+        # Evaluating inner-first keeps the intermediate at
+        # (dim_inner, dim_outer); negating and accumulating in place avoids
+        # the output-sized temporaries of the sign scaling and final add
+        out = np.asarray(
+            self.left_factor_matrix @ (
                 self.inner_square_matrix @ self.right_factor_matrix.array))
+        if self._sign == -1:
+            np.negative(out, out)
+        out += self.square_matrix.array
+        return out
 
     @property
     def capacitance_matrix(self):
         if self._capacitance_matrix is None:
-            self._capacitance_matrix = DenseSquareMatrix(
-                self.inner_square_matrix.inv.array +
+            product = np.asarray(
                 self.right_factor_matrix @ (
                     self.square_matrix.inv @ self.left_factor_matrix.array))
+            if product is self.left_factor_matrix.array:
+                # Identity components pass their operand through unchanged
+                # so copy before accumulating in place below
+                product = product.copy()
+            if self._inner_is_identity:
+                # Identity inner matrix contributes ones on the diagonal so
+                # accumulate in place rather than densifying the identity
+                product[np.diag_indices_from(product)] += 1.
+            else:
+                product += self.inner_square_matrix.inv.array
+            self._capacitance_matrix = DenseSquareMatrix(product)
         return self._capacitance_matrix
 
     @property
     def diagonal(self):
-        return self.square_matrix.diagonal + self._sign * (
-            (self.left_factor_matrix.array @ self.inner_square_matrix) *
-            self.right_factor_matrix.T.array).sum(1)
+        if self._diagonal is None:
+            dim_outer, dim_inner = self.left_factor_matrix.shape
+            if (_fast_kernels.NUMBA_AVAILABLE and
+                    dim_outer * dim_inner < 4096):
+                # At small sizes the BLAS dispatch overhead of the factor
+                # product dominates the actual arithmetic so a fused
+                # compiled kernel over the raw factor arrays is faster
+                self._diagonal = _fast_kernels.low_rank_update_diagonal(
+                    np.asarray(self.square_matrix.diagonal, np.float64),
+                    np.ascontiguousarray(self.left_factor_matrix.array),
+                    np.ascontiguousarray(self.inner_square_matrix.array),
+                    np.ascontiguousarray(self.right_factor_matrix.array),
+                    float(self._sign))
+            else:
+                # einsum fuses the elementwise product and row reduction
+                # into a single streaming pass instead of materialising the
+                # product buffer and summing it separately, with the
+                # transposed index labels on the right factor consuming its
+                # array in original layout without a transposed copy
+                self._diagonal = self.square_matrix.diagonal + (
+                    self._sign * np.einsum(
+                        'ij,ji->i',
+                        np.asarray(
+                            self.left_factor_matrix.array @
+                            self.inner_square_matrix),
+                        self.right_factor_matrix.array))
+        return self._diagonal
 
     @property
     def T(self):
@@ -1794,18 +2638,27 @@ class SquareLowRankUpdateMatrix(InvertibleMatrix, ImplicitArrayMatrix):
 
     @property
     def inv(self):
-        return type(self)(
-            self.square_matrix.inv @ self.left_factor_matrix,
-            self.right_factor_matrix @ self.square_matrix.inv,
-            self.square_matrix.inv, self.capacitance_matrix.inv,
-            self.inner_square_matrix.inv, -self._sign)
+        if self._inv is None:
+            # Evaluate the square matrix inverse once and reuse the same
+            # object for both factor products and the constructor argument,
+            # so any backing factorisation is computed and shared rather
+            # than re-derived per access
+            square_matrix_inv = self.square_matrix.inv
+            self._inv = type(self)(
+                square_matrix_inv @ self.left_factor_matrix,
+                self.right_factor_matrix @ square_matrix_inv,
+                square_matrix_inv, self.capacitance_matrix.inv,
+                self.inner_square_matrix.inv, -self._sign)
+        return self._inv
 
     @property
     def log_abs_det(self):
-        return (
-            self.square_matrix.log_abs_det +
-            self.inner_square_matrix.log_abs_det +
-            self.capacitance_matrix.log_abs_det)
+        if self._log_abs_det is None:
+            self._log_abs_det = (
+                self.square_matrix.log_abs_det +
+                self.inner_square_matrix.log_abs_det +
+                self.capacitance_matrix.log_abs_det)
+        return self._log_abs_det
 
 
 class SymmetricLowRankUpdateMatrix(
@@ -1858,10 +2711,19 @@ class SymmetricLowRankUpdateMatrix(
             sign (int): One of {-1, +1}, determining whether a low-rank update
                 (`sign = 1`) or 'downdate' (`sign = -1`) is peformed.
         """
-        if symmetric_matrix.T is not symmetric_matrix:
-            raise ValueError('symmetric_matrix must be symmetric')
-        if inner_symmetric_matrix.T is not inner_symmetric_matrix:
-            raise ValueError('inner_symmetric_matrix must be symmetric')
+        if inner_symmetric_matrix is None:
+            # Mirror the superclass defaulting so the subclass attribute
+            # holds a usable identity rather than the raw None
+            inner_symmetric_matrix = _identity_matrix_of_dim(
+                factor_matrix.shape[1])
+        # Symmetry checks are assertions so that they are elided when
+        # running under `python -O`, removing the per-construction `T`
+        # property evaluations from sampling loops which rebuild these
+        # matrices every iteration
+        assert symmetric_matrix.T is symmetric_matrix, (
+            'symmetric_matrix must be symmetric')
+        assert inner_symmetric_matrix.T is inner_symmetric_matrix, (
+            'inner_symmetric_matrix must be symmetric')
         self.factor_matrix = factor_matrix
         self.symmetric_matrix = symmetric_matrix
         self.inner_symmetric_matrix = inner_symmetric_matrix
@@ -1880,17 +2742,44 @@ class SymmetricLowRankUpdateMatrix(
     def capacitance_matrix(self):
         if self._capacitance_matrix is None:
             self._capacitance_matrix = DenseSymmetricMatrix(
-                self.inner_symmetric_matrix.inv.array +
-                self.factor_matrix.T @ (
-                    self.symmetric_matrix.inv @ self.factor_matrix.array))
+                self._construct_capacitance_array())
         return self._capacitance_matrix
 
+    def _construct_capacitance_array(self):
+        """Compute array form of capacitance matrix with a fused BLAS call.
+
+        Accumulates the `factor.T @ symmetric_matrix.inv @ factor` product
+        directly on to a copy of the inner matrix inverse with a single
+        `gemm` call, avoiding a separate capacitance-sized temporary for the
+        product followed by an elementwise add.
+        """
+        # Transposed factor matrices expose strided array views; copying to
+        # a contiguous buffer once here keeps the solve and gemm below on
+        # the fast unit-stride BLAS paths
+        factor_array = np.ascontiguousarray(self.factor_matrix.array)
+        inv_matrix_factor = np.asarray(
+            self.symmetric_matrix.inv @ factor_array)
+        gemm = sla.get_blas_funcs('gemm', (factor_array, inv_matrix_factor))
+        if self._inner_is_identity:
+            # Identity inner matrix inverse seeds the accumulator directly
+            # without densifying and copying the identity instance
+            accumulator = np.eye(self.factor_matrix.shape[1], order='F')
+        else:
+            accumulator = np.array(
+                self.inner_symmetric_matrix.inv.array, order='F')
+        return gemm(
+            1., factor_array, inv_matrix_factor, beta=1.,
+            c=accumulator, overwrite_c=True, trans_a=1)
+
     @property
     def inv(self):
-        return type(self)(
-            self.symmetric_matrix.inv @ self.factor_matrix,
-            self.symmetric_matrix.inv, self.capacitance_matrix.inv,
-            self.inner_symmetric_matrix.inv, -self._sign)
+        if self._inv is None:
+            symmetric_matrix_inv = self.symmetric_matrix.inv
+            self._inv = type(self)(
+                symmetric_matrix_inv @ self.factor_matrix,
+                symmetric_matrix_inv, self.capacitance_matrix.inv,
+                self.inner_symmetric_matrix.inv, -self._sign)
+        return self._inv
 
     @property
     def T(self):
@@ -1950,6 +2839,9 @@ class PositiveDefiniteLowRankUpdateMatrix(
             sign (int): One of {-1, +1}, determining whether a low-rank update
                 (`sign = 1`) or 'downdate' (`sign = -1`) is peformed.
         """
+        if inner_pos_def_matrix is None:
+            inner_pos_def_matrix = _identity_matrix_of_dim(
+                factor_matrix.shape[1])
         self.factor_matrix = factor_matrix
         self.pos_def_matrix = pos_def_matrix
         self.inner_pos_def_matrix = inner_pos_def_matrix
@@ -1974,11 +2866,12 @@ class PositiveDefiniteLowRankUpdateMatrix(
     @property
     def capacitance_matrix(self):
         if self._capacitance_matrix is None:
+            # Constructed matrix is cached on the instance, with its Cholesky
+            # factorisation computed lazily on first use and then shared
+            # between the `inv` and `log_abs_det` computations which depend
+            # on the capacitance matrix
             self._capacitance_matrix = DensePositiveDefiniteMatrix(
-                self.inner_pos_def_matrix.inv.array +
-                self.factor_matrix.T @ (
-                    self.pos_def_matrix.inv @
-                    self.factor_matrix.array))
+                self._construct_capacitance_array())
         return self._capacitance_matrix
 
     @property
@@ -1988,14 +2881,36 @@ class PositiveDefiniteLowRankUpdateMatrix(
         #   Ambikasaran, O'Neill & Singh (2016). Fast symmetric factorization
         #   of hierarchical matrices with applications. arxiv:1405.0223.
         # Variable naming below follows notation in Algorithm 1 in paper
-        W = self.pos_def_matrix.sqrt
-        K = self.inner_pos_def_matrix
-        U = W.inv @ self.factor_matrix
-        L = TriangularMatrix(nla.cholesky(U.T @ U.array))
-        I_outer, I_inner = IdentityMatrix(U.shape[0]), np.identity(U.shape[1])
-        M = sla.sqrtm(I_inner + L.T @ (K @ L.array))
-        X = DenseSymmetricMatrix(L.inv.T @ ((M - I_inner) @ L.inv))
-        return W @ SymmetricLowRankUpdateMatrix(U, I_outer, X)
+        if self._sqrt is None:
+            W = self.pos_def_matrix.sqrt
+            K = self.inner_pos_def_matrix
+            U = W.inv @ self.factor_matrix
+            L_array = nla.cholesky(U.T @ U.array)
+            L = TriangularMatrix(L_array)
+            I_outer = _identity_matrix_of_dim(U.shape[0])
+            I_inner = np.identity(U.shape[1])
+            # All operands in this chain share the (dim_inner, dim_inner)
+            # shape so no multiplication order is cheaper than another, and
+            # multiplying K as a structured matrix exploits any special
+            # structure it has rather than densifying it into the chain.
+            # The argument is symmetric positive-definite by construction so
+            # an eigendecomposition based square-root is used in place of
+            # the general Schur based scipy.linalg.sqrtm, with eigenvalues
+            # clipped at zero to guard against small negative rounding
+            # errors in borderline cases
+            sqrt_eigval, sqrt_eigvec = nla.eigh(
+                I_inner + L.T @ (K @ L_array))
+            M = (sqrt_eigvec * np.sqrt(np.maximum(sqrt_eigval, 0.))
+                 ) @ sqrt_eigvec.T
+            # X = L.inv.T @ (M - I_inner) @ L.inv computed with two
+            # triangular solves against the already computed Cholesky factor
+            # rather than forming L.inv twice
+            half_solved = sla.solve_triangular(
+                L_array, M - I_inner, lower=True, trans=1)
+            X = DenseSymmetricMatrix(sla.solve_triangular(
+                L_array, half_solved.T, lower=True, trans=1).T)
+            self._sqrt = W @ SymmetricLowRankUpdateMatrix(U, I_outer, X)
+        return self._sqrt
 
     @property
     def grad_log_abs_det(self):
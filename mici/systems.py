@@ -5,7 +5,8 @@ import logging
 import numpy as np
 from mici.states import cache_in_state, multi_cache_in_state
 from mici.matrices import (
-    IdentityMatrix, PositiveScaledIdentityMatrix, PositiveDiagonalMatrix,
+    Matrix, IdentityMatrix, PositiveScaledIdentityMatrix,
+    PositiveDiagonalMatrix,
     DenseSquareMatrix, TriangularFactoredPositiveDefiniteMatrix,
     DenseDefiniteMatrix, DensePositiveDefiniteMatrix, DenseSymmetricMatrix,
     EigendecomposedSymmetricMatrix, SoftAbsRegularisedPositiveDefiniteMatrix)
@@ -1145,8 +1146,13 @@ class RiemannianMetricSystem(System):
         # Evaluate VJP of metric function before metric as metric value will
         # potentially be computed in forward pass and cached
         vjp_metric = self.vjp_metric_func(state)
+        grad_log_abs_det = self.metric(state).grad_log_abs_det
+        if isinstance(grad_log_abs_det, Matrix):
+            # Densify any structured matrix gradient representation as vector-
+            # Jacobian product functions generally expect an array argument
+            grad_log_abs_det = grad_log_abs_det.array
         return (self.grad_neg_log_dens(state) +
-                0.5 * vjp_metric(self.metric(state).grad_log_abs_det))
+                0.5 * vjp_metric(grad_log_abs_det))
 
     def h2(self, state):
         return 0.5 * state.mom @ self.metric(state).inv @ state.mom
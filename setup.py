@@ -30,7 +30,7 @@ setuptools.setup(
     keywords='inference sampling MCMC HMC',
     license='MIT',
     license_file='LICENSE',
-    install_requires=['numpy>=1.15', 'scipy>=1.1'],
+    install_requires=['numpy>=1.15', 'scipy>=1.5'],
     python_requires='>=3.6',
     extras_require={
         'autodiff':  ['autograd>=1.2', 'multiprocess>=0.70'],
@@ -0,0 +1,191 @@
+import mici.matrices as matrices
+import mici._fast_kernels as _fast_kernels
+import numpy as np
+import numpy.linalg as nla
+import scipy.linalg as sla
+import numpy.testing as npt
+from unittest import SkipTest
+
+SEED = 3046987125
+ATOL = 1e-10
+# Sizes chosen to cover both sides of the dispatch thresholds in
+# mici.matrices: NUMBA_MATVEC_SIZE_THRESHOLD (128), the low-rank diagonal
+# kernel cutoff (4096 factor elements) and NUMEXPR_SIZE_THRESHOLD (2**16)
+KERNEL_SIZES = {1, 2, 5, 129, 300}
+
+
+def _require_numba():
+    if not _fast_kernels.NUMBA_AVAILABLE:
+        raise SkipTest('Numba not available. Skipping kernel tests.')
+
+
+def _random_triangular(rng, size, lower):
+    array = np.tril(rng.standard_normal((size, size)))
+    array[np.diag_indices(size)] = np.abs(array.diagonal()) + 0.5
+    return array if lower else array.T
+
+
+def test_scaled_triangular_outer():
+    _require_numba()
+    rng = np.random.RandomState(SEED)
+    for size in KERNEL_SIZES:
+        vector_l = rng.standard_normal(size)
+        vector_r = rng.standard_normal(size)
+        for scalar in [2.5, -1.5]:
+            npt.assert_allclose(
+                _fast_kernels.scaled_triangular_outer(
+                    vector_l, vector_r, scalar, True),
+                scalar * np.tril(np.outer(vector_l, vector_r)), atol=ATOL)
+            npt.assert_allclose(
+                _fast_kernels.scaled_triangular_outer(
+                    vector_l, vector_r, scalar, False),
+                scalar * np.triu(np.outer(vector_l, vector_r)), atol=ATOL)
+
+
+def test_log_abs_det_from_lu_diag():
+    _require_numba()
+    rng = np.random.RandomState(SEED)
+    for size in KERNEL_SIZES:
+        lu, _ = sla.lu_factor(
+            rng.standard_normal((size, size)) + size * np.identity(size))
+        npt.assert_allclose(
+            _fast_kernels.log_abs_det_from_lu_diag(lu),
+            np.log(np.abs(lu.diagonal())).sum(), atol=ATOL)
+
+
+def test_scale_upper_triangle():
+    _require_numba()
+    rng = np.random.RandomState(SEED)
+    for size in KERNEL_SIZES:
+        lu = rng.standard_normal((size, size))
+        for scalar in [2.5, -1.5]:
+            npt.assert_allclose(
+                _fast_kernels.scale_upper_triangle(lu, scalar),
+                lu + (scalar - 1) * np.triu(lu), atol=ATOL)
+
+
+def test_softabs_and_grad():
+    _require_numba()
+    rng = np.random.RandomState(SEED)
+    for size in KERNEL_SIZES:
+        eigval = rng.standard_normal(size)
+        for softabs_coeff in [0.5, 1., 2.]:
+            softabs_eigval, grad_softabs_eigval = (
+                _fast_kernels.softabs_and_grad(eigval, softabs_coeff))
+            npt.assert_allclose(
+                softabs_eigval,
+                eigval / np.tanh(eigval * softabs_coeff), atol=ATOL)
+            npt.assert_allclose(
+                grad_softabs_eigval,
+                1 / np.tanh(softabs_coeff * eigval) -
+                softabs_coeff * eigval / np.sinh(softabs_coeff * eigval)**2,
+                atol=ATOL)
+
+
+def test_softabs_grad_quadratic_form_inner():
+    _require_numba()
+    rng = np.random.RandomState(SEED)
+    for size in KERNEL_SIZES:
+        unreg_eigval = np.sort(rng.standard_normal(size))
+        softabs_coeff = 1.5
+        eigval = unreg_eigval / np.tanh(unreg_eigval * softabs_coeff)
+        grad_softabs_eigval = (
+            1 / np.tanh(softabs_coeff * unreg_eigval) -
+            softabs_coeff * unreg_eigval /
+            np.sinh(softabs_coeff * unreg_eigval)**2)
+        e_vct = rng.standard_normal(size)
+        numerator = eigval[:, None] - eigval[None, :]
+        denominator = unreg_eigval[:, None] - unreg_eigval[None, :]
+        denominator[np.diag_indices(size)] = 1.
+        j_mtx = numerator / denominator
+        j_mtx[np.diag_indices(size)] = grad_softabs_eigval
+        npt.assert_allclose(
+            _fast_kernels.softabs_grad_quadratic_form_inner(
+                eigval, unreg_eigval, grad_softabs_eigval, e_vct),
+            np.outer(e_vct, e_vct) * j_mtx, atol=ATOL)
+
+
+def test_tri_factored_matvec():
+    _require_numba()
+    rng = np.random.RandomState(SEED)
+    for size in KERNEL_SIZES:
+        vector = rng.standard_normal(size)
+        for lower in [True, False]:
+            factor = _random_triangular(rng, size, lower)
+            for sign in [1., -1.]:
+                npt.assert_allclose(
+                    _fast_kernels.tri_factored_matvec(
+                        factor, vector, sign, lower),
+                    sign * (factor @ (factor.T @ vector)), atol=ATOL)
+
+
+def test_low_rank_update_diagonal():
+    _require_numba()
+    rng = np.random.RandomState(SEED)
+    for dim_outer, dim_inner in [(1, 1), (5, 2), (129, 10), (300, 30)]:
+        base = rng.standard_normal(dim_outer)
+        left = rng.standard_normal((dim_outer, dim_inner))
+        inner = rng.standard_normal((dim_inner, dim_inner))
+        right = rng.standard_normal((dim_inner, dim_outer))
+        for sign in [1., -1.]:
+            npt.assert_allclose(
+                _fast_kernels.low_rank_update_diagonal(
+                    base, left, inner, right, sign),
+                base + sign * np.einsum(
+                    'ij,jk,ki->i', left, inner, right), atol=ATOL)
+
+
+def test_tri_factored_definite_matvec_both_sides_of_threshold():
+    # Sizes straddle NUMBA_MATVEC_SIZE_THRESHOLD so both the fused kernel
+    # and chained BLAS paths are compared against the dense product
+    rng = np.random.RandomState(SEED)
+    for size in [5, matrices.NUMBA_MATVEC_SIZE_THRESHOLD,
+                 matrices.NUMBA_MATVEC_SIZE_THRESHOLD + 1, 300]:
+        vector = rng.standard_normal(size)
+        for lower in [True, False]:
+            factor = _random_triangular(rng, size, lower)
+            for sign in [1, -1]:
+                matrix = matrices.TriangularFactoredDefiniteMatrix(
+                    matrices.TriangularMatrix(factor, lower=lower), sign=sign)
+                npt.assert_allclose(
+                    matrix @ vector, sign * (factor @ (factor.T @ vector)),
+                    atol=1e-8)
+
+
+def test_low_rank_update_diagonal_both_sides_of_threshold():
+    # Factor sizes straddle the 4096 element cutoff between the compiled
+    # kernel and einsum paths of SquareLowRankUpdateMatrix.diagonal
+    rng = np.random.RandomState(SEED)
+    for dim_outer, dim_inner in [(10, 3), (100, 40), (300, 30)]:
+        square_array = (
+            rng.standard_normal((dim_outer, dim_outer)) +
+            dim_outer * np.identity(dim_outer))
+        left = rng.standard_normal((dim_outer, dim_inner))
+        right = rng.standard_normal((dim_inner, dim_outer))
+        inner = rng.standard_normal((dim_inner, dim_inner))
+        for sign in [1, -1]:
+            matrix = matrices.SquareLowRankUpdateMatrix(
+                matrices.DenseRectangularMatrix(left),
+                matrices.DenseRectangularMatrix(right),
+                matrices.DenseSquareMatrix(square_array),
+                matrices.DenseSquareMatrix(inner), sign=sign)
+            npt.assert_allclose(
+                matrix.diagonal,
+                np.diagonal(square_array + sign * left @ inner @ right),
+                atol=1e-8)
+
+
+def test_diagonal_matrix_multiply_both_sides_of_threshold():
+    # Operand sizes straddle NUMEXPR_SIZE_THRESHOLD so both the numexpr
+    # and broadcasting paths of DiagonalMatrix multiplies are compared
+    # against the dense product
+    rng = np.random.RandomState(SEED)
+    size = 300
+    diagonal = rng.standard_normal(size)
+    matrix = matrices.DiagonalMatrix(diagonal)
+    for num_col in [2, 2 * matrices.NUMEXPR_SIZE_THRESHOLD // size]:
+        post = rng.standard_normal((size, num_col))
+        pre = rng.standard_normal((num_col, size))
+        npt.assert_allclose(
+            matrix @ post, diagonal[:, None] * post, atol=ATOL)
+        npt.assert_allclose(pre @ matrix, pre * diagonal, atol=ATOL)